@@ -33,6 +33,7 @@ async def lifespan(_app: FastAPI):
     
     # Shutdown
     logger.info("BallPulse application shutting down...")
+    await compare.async_reddit_service.aclose()
     logger.info("BallPulse application shutdown complete")
 
 
@@ -2,7 +2,7 @@ import logging
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
-from ..services.cache_service import CacheService
+from ..services.cache_service import CacheService, register_trusted_model
 from ..services.scoring_service import ScoringService
 from ..services.proscons_service import ProsConsService
 from ..services.sentiment_service import SentimentService
@@ -66,6 +66,7 @@ class Sources(BaseModel):
     stats: List[str] = Field(..., description="Stats source URLs")
 
 
+@register_trusted_model
 class CompareResponse(BaseModel):
     """Response model for compare endpoint"""
     team1: TeamAnalysis
@@ -5,11 +5,16 @@ Service for fetching Reddit posts and comments using async httpx.
 Supports both public JSON endpoints and PRAW (for authenticated requests).
 """
 
+import asyncio
+import importlib.util
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Optional
 import httpx
 
+from .reddit_service import _build_subreddit_lookup, _extract_post_id, _json_body, _team_key
+
 logger = logging.getLogger(__name__)
 
 # Try to import PRAW, but make it optional
@@ -58,6 +63,9 @@ class AsyncRedditService:
         "houston rockets": "rockets",
     }
     
+    # Normalized lookup (built once at class creation) covering full names and aliases
+    _NORM_MAP = _build_subreddit_lookup(TEAM_SUBREDDIT_MAP)
+    
     def __init__(
         self,
         timeout: float = 10.0,
@@ -85,6 +93,11 @@ class AsyncRedditService:
             'User-Agent': 'BallPulse/1.0 (Python/AsyncRedditService)'
         }
         
+        # One pooled client per event loop so keep-alive connections (and
+        # HTTP/2 multiplexing when h2 is installed) survive across requests
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Initialize PRAW if credentials are available (for fallback)
         self.praw_client = None
         if PRAW_AVAILABLE:
@@ -105,8 +118,46 @@ class AsyncRedditService:
     
     def _get_team_subreddit(self, team_name: str) -> Optional[str]:
         """Get subreddit name for a team"""
-        team_lower = team_name.lower()
-        return self.TEAM_SUBREDDIT_MAP.get(team_lower)
+        return self._NORM_MAP.get(_team_key(team_name))
+    
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with this service's timeout, headers and pool limits"""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self.headers,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+    
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yield the pooled client when running on the loop that owns it
+        
+        The pool is (re)bound to the running loop when it is missing, closed
+        or its loop has closed. Callers on another live loop (e.g. the
+        deprecated sync wrapper's thread) get a short-lived client that is
+        closed on exit, so no client is left behind unclosed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop.is_closed():
+            self._client = self._new_client()
+            self._client_loop = loop
+        
+        if self._client_loop is loop:
+            yield self._client
+        else:
+            async with self._new_client() as client:
+                yield client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if it belongs to the running event loop"""
+        if self._client_loop is not asyncio.get_running_loop():
+            return
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
     
     async def _fetch_json_endpoint(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -120,10 +171,10 @@ class AsyncRedditService:
         """
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
+                async with self._http_client() as client:
                     response = await client.get(url)
-                    response.raise_for_status()
-                    return response.json()
+                response.raise_for_status()
+                return _json_body(response)
             except httpx.TimeoutException:
                 self.logger.warning("Timeout fetching %s (attempt %d/%d)", url, attempt + 1, self.max_retries)
             except httpx.HTTPStatusError as e:
@@ -234,19 +285,23 @@ class AsyncRedditService:
         Returns:
             List of post dictionaries with text and URLs
         """
-        # Check cache
-        if self.cache_service:
-            cache_key = f"reddit:team:{team_name.lower()}:{limit}"
-            cached = self.cache_service.cache.get(cache_key)
-            if cached:
-                self.logger.info("Cache hit for team posts: %s", team_name)
-                return cached
+        team_key = _team_key(team_name)
         
-        subreddit = self._get_team_subreddit(team_name)
+        # Unknown teams are rejected by the in-memory map before any cache I/O
+        subreddit = self._NORM_MAP.get(team_key)
         if not subreddit:
             self.logger.warning("No subreddit mapping found for team: %s", team_name)
             return []
         
+        cache_key = f"reddit:team:{team_key}:{limit}"
+        
+        # Check cache
+        if self.cache_service:
+            cached = self.cache_service.get_by_key(cache_key)
+            if cached is not None:
+                self.logger.info("Cache hit for team posts: %s", team_name)
+                return cached
+        
         # Use async JSON API
         posts = await self._fetch_posts_json(subreddit, limit=limit)
         
@@ -255,7 +310,7 @@ class AsyncRedditService:
             import asyncio
             
             async def fetch_post_comments(post: Dict[str, Any]) -> None:
-                post_id = post['url'].split('/')[-3] if '/' in post['url'] else None
+                post_id = _extract_post_id(post['url'])
                 if post_id:
                     comments = await self._fetch_comments_json(post_id)
                     post['comments'] = comments
@@ -263,10 +318,9 @@ class AsyncRedditService:
             # Fetch comments for top 5 posts in parallel
             await asyncio.gather(*[fetch_post_comments(post) for post in posts[:5]])
         
-        # Cache the result
-        if self.cache_service:
-            cache_key = f"reddit:team:{team_name.lower()}:{limit}"
-            self.cache_service.cache.set(cache_key, posts, expire=self.cache_ttl)
+        # Cache the result (empty results are fetch failures; don't pin them for the full TTL)
+        if self.cache_service and posts:
+            self.cache_service.set_by_key(cache_key, posts, ttl=self.cache_ttl)
         
         return posts
     
@@ -285,11 +339,12 @@ class AsyncRedditService:
         Returns:
             List of post dictionaries with text and URLs
         """
+        cache_key = f"reddit:nba:{limit}"
+        
         # Check cache
         if self.cache_service:
-            cache_key = f"reddit:nba:{limit}"
-            cached = self.cache_service.cache.get(cache_key)
-            if cached:
+            cached = self.cache_service.get_by_key(cache_key)
+            if cached is not None:
                 self.logger.info("Cache hit for r/nba posts")
                 return cached
         
@@ -301,7 +356,7 @@ class AsyncRedditService:
             import asyncio
             
             async def fetch_post_comments(post: Dict[str, Any]) -> None:
-                post_id = post['url'].split('/')[-3] if '/' in post['url'] else None
+                post_id = _extract_post_id(post['url'])
                 if post_id:
                     comments = await self._fetch_comments_json(post_id)
                     post['comments'] = comments
@@ -309,10 +364,9 @@ class AsyncRedditService:
             # Fetch comments for top 5 posts in parallel
             await asyncio.gather(*[fetch_post_comments(post) for post in posts[:5]])
         
-        # Cache the result
-        if self.cache_service:
-            cache_key = f"reddit:nba:{limit}"
-            self.cache_service.cache.set(cache_key, posts, expire=self.cache_ttl)
+        # Cache the result (empty results are fetch failures; don't pin them for the full TTL)
+        if self.cache_service and posts:
+            self.cache_service.set_by_key(cache_key, posts, ttl=self.cache_ttl)
         
         return posts
 
@@ -337,47 +391,32 @@ class RedditService:
         # Delegate to async service for actual implementation
         self._async_service = AsyncRedditService(*args, **kwargs)
     
-    def fetch_team_posts(self, team_name: str, limit: int = 10, include_comments: bool = True):
-        """Synchronous wrapper - blocks event loop (deprecated)"""
-        import asyncio
+    def _run(self, method: str, *args: Any) -> List[Dict[str, Any]]:
+        """Run an async service method to completion (deprecated blocking path)"""
+        async def call_and_close() -> List[Dict[str, Any]]:
+            # The next call may run on another loop, so don't leave the client open
+            try:
+                return await getattr(self._async_service, method)(*args)
+            finally:
+                await self._async_service.aclose()
+        
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
                 # If already in async context, create a new thread
                 import concurrent.futures
                 with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_service.fetch_team_posts(team_name, limit, include_comments)
-                    )
+                    future = executor.submit(asyncio.run, call_and_close())
                     return future.result()
             else:
-                return loop.run_until_complete(
-                    self._async_service.fetch_team_posts(team_name, limit, include_comments)
-                )
+                return loop.run_until_complete(call_and_close())
         except RuntimeError:
-            return asyncio.run(
-                self._async_service.fetch_team_posts(team_name, limit, include_comments)
-            )
+            return asyncio.run(call_and_close())
+    
+    def fetch_team_posts(self, team_name: str, limit: int = 10, include_comments: bool = True):
+        """Synchronous wrapper - blocks event loop (deprecated)"""
+        return self._run('fetch_team_posts', team_name, limit, include_comments)
     
     def fetch_nba_posts(self, limit: int = 25, include_comments: bool = True):
         """Synchronous wrapper - blocks event loop (deprecated)"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._async_service.fetch_nba_posts(limit, include_comments)
-                    )
-                    return future.result()
-            else:
-                return loop.run_until_complete(
-                    self._async_service.fetch_nba_posts(limit, include_comments)
-                )
-        except RuntimeError:
-            return asyncio.run(
-                self._async_service.fetch_nba_posts(limit, include_comments)
-            )
+        return self._run('fetch_nba_posts', limit, include_comments)
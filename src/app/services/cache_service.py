@@ -1,22 +1,210 @@
 import logging
 import hashlib
+import importlib
 import json
-from typing import Optional, Any
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Any, Dict, Set, Tuple, Type, Union, get_args, get_origin
 import diskcache
+from pydantic import BaseModel
 from ..config import cfg
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# One-byte codec headers for disk cache payloads
+_CODEC_JSON = b"J"
+_CODEC_MODEL = b"P"
+_CODEC_PICKLE = b"K"
+
+
+def _json_dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        # Pass datetimes/dataclasses/subclasses through to the TypeError
+        # branch so they round-trip via pickle instead of becoming strings
+        return orjson.dumps(
+            value,
+            option=orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS,
+        )
+    return json.dumps(value, allow_nan=False).encode()
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+# Models whose cached payloads are rebuilt with model_construct (no validation)
+_TRUSTED_MODELS: Set[str] = set()
+
+
+def _model_path(model_cls: type) -> str:
+    return f"{model_cls.__module__}:{model_cls.__qualname__}"
+
+
+def register_trusted_model(model_cls: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Mark a Pydantic model as safe to rebuild from cache without validation
+    
+    Only register models whose fields (at any depth) are other models or
+    JSON-native types, since model_construct does no type coercion.
+    Usable as a class decorator.
+    """
+    _TRUSTED_MODELS.add(_model_path(model_cls))
+    return model_cls
+
+
+def _construct_model(model_cls: Type[BaseModel], data: Any) -> Any:
+    """Recursively model_construct a payload parsed from model_dump_json() output"""
+    if not isinstance(data, dict):
+        return data
+    values = {}
+    for name, value in data.items():
+        field = model_cls.model_fields.get(name)
+        values[name] = _construct_field(field.annotation, value) if field else value
+    return model_cls.model_construct(**values)
+
+
+def _construct_field(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct_model(annotation, value)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        models = [arg for arg in args if isinstance(arg, type) and issubclass(arg, BaseModel)]
+        return _construct_model(models[0], value) if len(models) == 1 else value
+    if origin is list and args and isinstance(value, list):
+        return [_construct_field(args[0], item) for item in value]
+    return value
+
+
+def _encode_value(value: Any) -> bytes:
+    """
+    Serialize a cache value to bytes prefixed with a codec header
+    
+    Pydantic models and plain dicts/lists are stored as JSON; anything
+    JSON can't represent faithfully (NaN/inf, tuples, non-string keys)
+    falls back to pickle, so disk hits match the in-process layer.
+    """
+    try:
+        if isinstance(value, BaseModel):
+            # "<module>:<qualname>\n<json>"; model_dump_json serializes in
+            # pydantic-core without building an intermediate dict
+            return b"".join((
+                _CODEC_MODEL,
+                _model_path(type(value)).encode(),
+                b"\n",
+                value.model_dump_json().encode(),
+            ))
+        if type(value) in (dict, list):
+            encoded = _json_dumps(value)
+            # NaN != NaN and tuple != list, so lossy values fail this check
+            if _json_loads(encoded) == value:
+                return _CODEC_JSON + encoded
+    except (TypeError, ValueError):
+        pass
+    return _CODEC_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_value(raw: Any) -> Any:
+    """Inverse of _encode_value; entries written before codecs pass through"""
+    if not isinstance(raw, bytes) or not raw:
+        return raw
+    codec, payload = raw[:1], raw[1:]
+    if codec == _CODEC_JSON:
+        return _json_loads(payload)
+    if codec == _CODEC_MODEL:
+        header, sep, body = payload.partition(b"\n")
+        if not sep:
+            raise ValueError("model payload missing class header")
+        path = header.decode()
+        module_name, _, qualname = path.partition(":")
+        model_cls: Any = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            model_cls = getattr(model_cls, attr)
+        if path in _TRUSTED_MODELS:
+            # Payload came from our own serializer; skip re-validation
+            return _construct_model(model_cls, _json_loads(body))
+        return model_cls.model_validate_json(body)
+    if codec == _CODEC_PICKLE:
+        return pickle.loads(payload)
+    return raw
+
+
+@lru_cache(maxsize=1024)
+def _compare_key(sport: str, team1: str, team2: str, date: Optional[str]) -> str:
+    """Build the compare cache key; memoized since the same matchups recur"""
+    # Normalize team names (sort to ensure consistent key regardless of order)
+    key_tuple = (sport.lower(), *sorted((team1.lower(), team2.lower())), date.lower() if date else "")
+    # Non-cryptographic use: blake2b is faster than md5 and repr() keeps fields unambiguous
+    key_hash = hashlib.blake2b(repr(key_tuple).encode(), digest_size=16).hexdigest()
+    return f"compare:{key_hash}"
+
+
+class _LocalTTLCache:
+    """Bounded, thread-safe in-process LRU with per-entry expiry"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (found, value); expired entries count as not found"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class _DiskCacheBackend:
-    def __init__(self, cache_dir: str):
-        self.cache = diskcache.Cache(cache_dir)
+    def __init__(self, cache_dir: str, size_limit: int, eviction_policy: str):
+        self.cache = diskcache.Cache(cache_dir, size_limit=size_limit, eviction_policy=eviction_policy)
 
     def get(self, key: str) -> Optional[Any]:
-        return self.cache.get(key)
+        raw = self.cache.get(key)
+        if raw is None:
+            return None
+        try:
+            return _decode_value(raw)
+        except (ValueError, TypeError, KeyError, AttributeError, ImportError, pickle.UnpicklingError):
+            logger.warning("Failed to decode disk cache payload for key=%s", key)
+            return None
 
     def set(self, key: str, value: Any, ttl: int) -> bool:
-        return bool(self.cache.set(key, value, expire=ttl))
+        return bool(self.cache.set(key, _encode_value(value), expire=ttl))
 
     def delete(self, key: str) -> bool:
         return bool(self.cache.delete(key))
@@ -27,6 +215,40 @@ class _DiskCacheBackend:
         return count
 
 
+class _MemoryCacheBackend:
+    """Process-local dict backend (tests, single-process dev runs)"""
+
+    def __init__(self):
+        self._store: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._store[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        with self._lock:
+            self._store[key] = (time.monotonic() + ttl, value)
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._store.pop(key, None) is not None
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._store)
+            self._store.clear()
+        return count
+
+
 class _RedisCacheBackend:
     def __init__(self, redis_url: str):
         try:
@@ -68,6 +290,11 @@ class _RedisCacheBackend:
 class CacheService:
     """Cache service with optional Redis backend and diskcache fallback."""
     
+    # The in-process layer can't see writes/deletes made by other workers, so
+    # its entries live at most L1_MAX_TTL seconds (misses only L1_MISS_TTL)
+    L1_MAX_TTL = 60
+    L1_MISS_TTL = 5
+    
     def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600, backend: Optional[str] = None):
         """
         Initialize cache service
@@ -75,12 +302,21 @@ class CacheService:
         Args:
             cache_dir: Directory for cache storage
             default_ttl: Default TTL in seconds (default: 1 hour)
-            backend: "disk" or "redis". Defaults to config/env-driven selection.
+            backend: "disk", "redis" or "memory". Defaults to config/env-driven selection.
         """
         self.default_ttl = default_ttl
         cache_cfg = cfg.get("cache", {})
+        # In-process layer in front of the backend: repeat gets skip the
+        # disk/redis round trip and deserialization. Values are shared, so
+        # callers must treat cached objects as read-only.
+        self._l1 = _LocalTTLCache(maxsize=int(cache_cfg.get("l1_maxsize", 1024)))
         selected_backend = (backend or cache_cfg.get("backend", "disk")).lower()
 
+        if selected_backend == "memory":
+            self.backend = _MemoryCacheBackend()
+            logger.info("Cache service initialized with in-memory backend default_ttl=%ss", default_ttl)
+            return
+
         if selected_backend == "redis":
             redis_url = cache_cfg.get("redis_url")
             if redis_url:
@@ -93,7 +329,15 @@ class CacheService:
             else:
                 logger.warning("Redis cache backend selected but redis_url missing; falling back to diskcache")
 
-        self.backend = _DiskCacheBackend(cache_dir=cache_dir)
+        # Cap the disk cache below diskcache's 1 GB default. Eviction stays
+        # least-recently-stored (set explicitly, since diskcache persists the
+        # policy in the cache dir): LRU/LFU policies turn every get into a
+        # SQLite write
+        self.backend = _DiskCacheBackend(
+            cache_dir=cache_dir,
+            size_limit=int(cache_cfg.get("disk_size_limit_mb", 256)) * 1024 * 1024,
+            eviction_policy="least-recently-stored",
+        )
         logger.info("Cache service initialized with diskcache backend cache_dir=%s default_ttl=%ss", cache_dir, default_ttl)
     
     def _generate_key(self, sport: str, team1: str, team2: str, date: Optional[str] = None) -> str:
@@ -109,17 +353,7 @@ class CacheService:
         Returns:
             Cache key string
         """
-        # Normalize team names (sort to ensure consistent key regardless of order)
-        teams = sorted([team1.lower(), team2.lower()])
-        key_data = {
-            "sport": sport.lower(),
-            "team1": teams[0],
-            "team2": teams[1],
-            "date": date.lower() if date else None
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.md5(key_string.encode()).hexdigest()
-        return f"compare:{key_hash}"
+        return _compare_key(sport, team1, team2, date)
     
     def get(self, sport: str, team1: str, team2: str, date: Optional[str] = None) -> Optional[Any]:
         """
@@ -135,7 +369,7 @@ class CacheService:
             Cached value or None if not found/expired
         """
         key = self._generate_key(sport, team1, team2, date)
-        value = self.backend.get(key)
+        value = self._get_layered(key)
         if value is not None:
             logger.info("Cache hit for key: %s", key)
         else:
@@ -160,7 +394,7 @@ class CacheService:
         """
         key = self._generate_key(sport, team1, team2, date)
         ttl = ttl if ttl is not None else self.default_ttl
-        result = self.backend.set(key, value, ttl=ttl)
+        result = self._set_layered(key, value, ttl)
         logger.info("Cached value for key: %s with TTL: %ss", key, ttl)
         return result
     
@@ -178,6 +412,7 @@ class CacheService:
             True if deleted, False if not found
         """
         key = self._generate_key(sport, team1, team2, date)
+        self._l1.delete(key)
         result = self.backend.delete(key)
         logger.info("Deleted cache entry for key: %s", key)
         return result
@@ -189,13 +424,14 @@ class CacheService:
         Returns:
             Number of entries cleared
         """
+        self._l1.clear()
         count = self.backend.clear()
         logger.info("Cleared %d cache entries", count)
         return count
 
     def get_by_key(self, key: str) -> Optional[Any]:
         """Get a value by an arbitrary cache key."""
-        value = self.backend.get(key)
+        value = self._get_layered(key)
         if value is not None:
             logger.debug("Cache hit for key: %s", key)
         return value
@@ -203,7 +439,24 @@ class CacheService:
     def set_by_key(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Store a value under an arbitrary cache key."""
         ttl = ttl if ttl is not None else self.default_ttl
-        result = self.backend.set(key, value, ttl=ttl)
+        result = self._set_layered(key, value, ttl)
         logger.debug("Cached value for key: %s with TTL: %ss", key, ttl)
         return result
 
+    def _get_layered(self, key: str) -> Optional[Any]:
+        """Read through the in-process layer, remembering backend misses briefly."""
+        found, value = self._l1.get(key)
+        if found:
+            return value
+        value = self.backend.get(key)
+        if value is None:
+            self._l1.set(key, None, ttl=min(self.L1_MISS_TTL, self.default_ttl))
+        else:
+            self._l1.set(key, value, ttl=min(self.L1_MAX_TTL, self.default_ttl))
+        return value
+
+    def _set_layered(self, key: str, value: Any, ttl: int) -> bool:
+        """Write to the backend and refresh the in-process layer."""
+        result = self.backend.set(key, value, ttl=ttl)
+        self._l1.set(key, value, ttl=min(self.L1_MAX_TTL, ttl))
+        return result
@@ -1,9 +1,25 @@
 import logging
+import re
 from typing import List, Dict, Any, Optional
 
+from .scoring_service import _SIGNIFICANT_INJURY_RE
+
 logger = logging.getLogger(__name__)
 
 
+def _substring_re(words: List[str]) -> "re.Pattern[str]":
+    """Compile a pattern matching any of the words anywhere in lowercased text"""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Sentiment summary triggers (substring matches on the lowercased summary)
+_POSITIVE_MOOD_RE = _substring_re(['positive', 'optimistic', 'confident'])
+_ENTHUSIASM_RE = _substring_re(['strong', 'excellent', 'great'])
+_NEGATIVE_MOOD_RE = _substring_re(['negative', 'concerns', 'worries', 'uncertainty'])
+_DISAPPOINTMENT_RE = _substring_re(['poor', 'disappointing', 'struggling'])
+_UNCERTAIN_RE = _substring_re(['mixed', 'uncertain'])
+
+
 class ProsConsService:
     """Service for generating pros and cons for teams based on stats, injuries, and sentiment"""
     
@@ -120,9 +136,9 @@ class ProsConsService:
         
         summary_lower = sentiment_summary.lower()
         
-        if any(word in summary_lower for word in ['positive', 'optimistic', 'confident']):
+        if _POSITIVE_MOOD_RE.search(summary_lower):
             pros.append("Positive fan and community sentiment")
-        if any(word in summary_lower for word in ['strong', 'excellent', 'great']):
+        if _ENTHUSIASM_RE.search(summary_lower):
             pros.append("Strong community support and enthusiasm")
         if 'confidence' in summary_lower and 'high' in summary_lower:
             pros.append("High confidence in team performance")
@@ -138,11 +154,11 @@ class ProsConsService:
         
         summary_lower = sentiment_summary.lower()
         
-        if any(word in summary_lower for word in ['negative', 'concerns', 'worries', 'uncertainty']):
+        if _NEGATIVE_MOOD_RE.search(summary_lower):
             cons.append("Community sentiment shows concerns")
-        if any(word in summary_lower for word in ['poor', 'disappointing', 'struggling']):
+        if _DISAPPOINTMENT_RE.search(summary_lower):
             cons.append("Disappointing performance from fan perspective")
-        if 'mixed' in summary_lower or 'uncertain' in summary_lower:
+        if _UNCERTAIN_RE.search(summary_lower):
             cons.append("Uncertainty in team outlook")
         
         return cons
@@ -167,7 +183,7 @@ class ProsConsService:
         # Count significant injuries
         significant_injuries = [
             inj for inj in injuries
-            if any(word in inj.lower() for word in ['out', 'injured', 'surgery', 'fracture', 'torn'])
+            if _SIGNIFICANT_INJURY_RE.search(inj)
         ]
         
         if len(significant_injuries) >= 2:
@@ -1,10 +1,16 @@
 import logging
 import os
-from typing import List, Dict, Any, Optional
+import re
+import threading
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..utils.team_normalizer import TeamNormalizer
+
 logger = logging.getLogger(__name__)
 
 # Try to import PRAW, but make it optional
@@ -15,6 +21,48 @@ except ImportError:
     PRAW_AVAILABLE = False
     praw = None
 
+# orjson parses Reddit listings noticeably faster than the stdlib decoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Post ID segment of a Reddit permalink: /r/<sub>/comments/<id>/<slug>/
+_POST_ID_RE = re.compile(r'/comments/([a-z0-9]+)/')
+
+
+def _extract_post_id(url: str) -> Optional[str]:
+    """Extract the post ID from a Reddit post URL, or None if it isn't a post URL"""
+    match = _POST_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _json_body(response: Any) -> Any:
+    """Decode a requests or httpx JSON response body, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _team_key(team_name: str) -> str:
+    """Normalize a team name into a lookup key (compat form, trimmed, casefolded)"""
+    return unicodedata.normalize('NFKC', team_name).strip().casefold()
+
+
+def _build_subreddit_lookup(team_subreddit_map: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build the normalized team -> subreddit lookup, including the aliases
+    known to TeamNormalizer (e.g. "LA Lakers", "Sixers", "OKC")
+    """
+    lookup = {}
+    for alias, full_name in TeamNormalizer.TEAM_NAME_MAP.items():
+        subreddit = team_subreddit_map.get(full_name.lower())
+        if subreddit:
+            lookup[_team_key(alias)] = subreddit
+    lookup.update((_team_key(name), sub) for name, sub in team_subreddit_map.items())
+    return lookup
+
 
 class RedditService:
     """Service for fetching Reddit posts and comments using public JSON endpoints or PRAW"""
@@ -53,6 +101,19 @@ class RedditService:
         "houston rockets": "rockets",
     }
     
+    # Process-wide requests sessions, keyed by retry count
+    _SESSIONS: Dict[int, requests.Session] = {}
+    _SESSIONS_LOCK = threading.Lock()
+    
+    # Process-wide worker pool for fetching the top posts' comments concurrently
+    # (requests releases the GIL while waiting on the socket); created on first use
+    _IO_POOL: Optional[ThreadPoolExecutor] = None
+    _IO_POOL_WORKERS = 10
+    _IO_POOL_LOCK = threading.Lock()
+    
+    # Normalized lookup (built once at class creation) covering full names and aliases
+    _NORM_MAP = _build_subreddit_lookup(TEAM_SUBREDDIT_MAP)
+    
     def __init__(
         self,
         timeout: int = 10,
@@ -75,22 +136,15 @@ class RedditService:
         self.cache_service = cache_service
         self.cache_ttl = cache_ttl
         
-        # Setup requests session with retries
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # User-Agent is required by Reddit API
-        self.session.headers.update({
-            'User-Agent': 'BallPulse/1.0 (Python/RedditService)'
-        })
+        # Worker pool for concurrent comment fetches (shared across instances)
+        self._io_pool = self._shared_io_pool()
+        
+        # In-flight fetches by cache key, so concurrent misses share one fetch
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Setup requests session with retries (shared across instances)
+        self.session = self._shared_session(max_retries)
         
         # Initialize PRAW if credentials are available
         self.praw_client = None
@@ -110,10 +164,56 @@ class RedditService:
                 except Exception as e:
                     self.logger.warning(f"Failed to initialize PRAW client: {e}")
     
+    @classmethod
+    def _shared_session(cls, max_retries: int) -> requests.Session:
+        """
+        Get the process-wide session for a retry policy, creating it on first use
+        
+        Sharing the session keeps its kept-alive connections (and their TLS
+        handshakes) across RedditService instances.
+        """
+        with cls._SESSIONS_LOCK:
+            session = cls._SESSIONS.get(max_retries)
+            if session is None:
+                session = requests.Session()
+                retry_strategy = Retry(
+                    total=max_retries,
+                    backoff_factor=1,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"]
+                )
+                # Size the pool so concurrent comment fetches (and several services
+                # hitting reddit.com at once) keep reusing kept-alive connections
+                adapter = HTTPAdapter(
+                    max_retries=retry_strategy,
+                    pool_connections=20,
+                    pool_maxsize=50,
+                    pool_block=False
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                
+                # User-Agent is required by Reddit API
+                session.headers.update({
+                    'User-Agent': 'BallPulse/1.0 (Python/RedditService)'
+                })
+                cls._SESSIONS[max_retries] = session
+            return session
+    
+    @classmethod
+    def _shared_io_pool(cls) -> ThreadPoolExecutor:
+        """Get the process-wide comment-fetch worker pool, creating it on first use"""
+        with cls._IO_POOL_LOCK:
+            if cls._IO_POOL is None:
+                cls._IO_POOL = ThreadPoolExecutor(
+                    max_workers=cls._IO_POOL_WORKERS,
+                    thread_name_prefix="reddit-io"
+                )
+            return cls._IO_POOL
+    
     def _get_team_subreddit(self, team_name: str) -> Optional[str]:
         """Get subreddit name for a team"""
-        team_lower = team_name.lower()
-        return self.TEAM_SUBREDDIT_MAP.get(team_lower)
+        return self._NORM_MAP.get(_team_key(team_name))
     
     def _fetch_json_endpoint(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -129,7 +229,7 @@ class RedditService:
             # User-Agent is already set in session headers
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return _json_body(response)
         except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(f"Error fetching Reddit JSON endpoint {url}: {e}")
             return None
@@ -279,6 +379,83 @@ class RedditService:
             self.logger.error(f"Error fetching comments with PRAW: {e}")
             return []
     
+    def _singleflight(self, key: str, fn: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Run fn for key unless a fetch for the same key is already in flight,
+        in which case wait for and return that fetch's result instead
+        
+        Args:
+            key: Cache key identifying the fetch
+            fn: Function performing the fetch
+            
+        Returns:
+            Result of fn (from this call or the in-flight one)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            self.logger.debug(f"Joining in-flight Reddit fetch for {key}")
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _fetch_with_comments(
+        self,
+        subreddit: str,
+        limit: int,
+        include_comments: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch posts from a subreddit and attach sample comments to the top 5
+        
+        Args:
+            subreddit: Subreddit name
+            limit: Maximum number of posts to fetch
+            include_comments: Whether to include sample comments
+            
+        Returns:
+            List of post dictionaries
+        """
+        # Pick PRAW or the JSON API once, rather than per post.
+        # PRAW is not thread-safe, so only JSON API comment fetches run in the pool.
+        if self.praw_client:
+            posts = self._fetch_posts_praw(subreddit, limit=limit)
+            map_posts = map
+            
+            def fetch_comments(post: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+                return self._fetch_comments_praw(post['url'], limit=5)
+        else:
+            posts = self._fetch_posts_json(subreddit, limit=limit)
+            map_posts = self._io_pool.map
+            
+            def fetch_comments(post: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+                post_id = _extract_post_id(post['url'])
+                return self._fetch_comments_json(post_id) if post_id else None
+        
+        # Add comments if requested
+        if include_comments and posts:
+            top_posts = posts[:5]  # Add comments to top 5 posts
+            for post, comments in zip(top_posts, map_posts(fetch_comments, top_posts)):
+                if comments is not None:
+                    post['comments'] = comments
+        
+        return posts
+    
     def fetch_team_posts(
         self,
         team_name: str,
@@ -296,43 +473,33 @@ class RedditService:
         Returns:
             List of post dictionaries with text and URLs
         """
-        # Check cache
-        if self.cache_service:
-            cache_key = f"reddit:team:{team_name.lower()}:{limit}"
-            cached = self.cache_service.cache.get(cache_key)
-            if cached:
-                self.logger.info(f"Cache hit for team posts: {team_name}")
-                return cached
+        team_key = _team_key(team_name)
         
-        subreddit = self._get_team_subreddit(team_name)
+        # Unknown teams are rejected by the in-memory map before any cache I/O
+        subreddit = self._NORM_MAP.get(team_key)
         if not subreddit:
             self.logger.warning(f"No subreddit mapping found for team: {team_name}")
             return []
         
-        # Try PRAW first if available, otherwise use JSON API
-        if self.praw_client:
-            posts = self._fetch_posts_praw(subreddit, limit=limit)
-        else:
-            posts = self._fetch_posts_json(subreddit, limit=limit)
-        
-        # Add comments if requested
-        if include_comments and posts:
-            for post in posts[:5]:  # Add comments to top 5 posts
-                post_id = post['url'].split('/')[-3] if '/' in post['url'] else None
-                if post_id and not self.praw_client:
-                    # Extract post ID from URL for JSON API
-                    comments = self._fetch_comments_json(post_id)
-                    post['comments'] = comments
-                elif self.praw_client:
-                    comments = self._fetch_comments_praw(post['url'], limit=5)
-                    post['comments'] = comments
+        cache_key = f"reddit:team:{team_key}:{limit}"
         
-        # Cache the result
+        # Check cache
         if self.cache_service:
-            cache_key = f"reddit:team:{team_name.lower()}:{limit}"
-            self.cache_service.cache.set(cache_key, posts, expire=self.cache_ttl)
+            cached = self.cache_service.cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Cache hit for team posts: {team_name}")
+                return cached
         
-        return posts
+        def fetch() -> List[Dict[str, Any]]:
+            posts = self._fetch_with_comments(subreddit, limit, include_comments)
+            
+            # Cache the result (empty results are fetch failures; don't pin them for the full TTL)
+            if self.cache_service and posts:
+                self.cache_service.cache.set(cache_key, posts, expire=self.cache_ttl)
+            
+            return posts
+        
+        return self._singleflight(cache_key, fetch)
     
     def fetch_nba_posts(
         self,
@@ -349,35 +516,23 @@ class RedditService:
         Returns:
             List of post dictionaries with text and URLs
         """
+        cache_key = f"reddit:nba:{limit}"
+        
         # Check cache
         if self.cache_service:
-            cache_key = f"reddit:nba:{limit}"
             cached = self.cache_service.cache.get(cache_key)
-            if cached:
+            if cached is not None:
                 self.logger.info("Cache hit for r/nba posts")
                 return cached
         
-        # Try PRAW first if available, otherwise use JSON API
-        if self.praw_client:
-            posts = self._fetch_posts_praw('nba', limit=limit)
-        else:
-            posts = self._fetch_posts_json('nba', limit=limit)
-        
-        # Add comments if requested
-        if include_comments and posts:
-            for post in posts[:5]:  # Add comments to top 5 posts
-                post_id = post['url'].split('/')[-3] if '/' in post['url'] else None
-                if post_id and not self.praw_client:
-                    comments = self._fetch_comments_json(post_id)
-                    post['comments'] = comments
-                elif self.praw_client:
-                    comments = self._fetch_comments_praw(post['url'], limit=5)
-                    post['comments'] = comments
-        
-        # Cache the result
-        if self.cache_service:
-            cache_key = f"reddit:nba:{limit}"
-            self.cache_service.cache.set(cache_key, posts, expire=self.cache_ttl)
+        def fetch() -> List[Dict[str, Any]]:
+            posts = self._fetch_with_comments('nba', limit, include_comments)
+            
+            # Cache the result (empty results are fetch failures; don't pin them for the full TTL)
+            if self.cache_service and posts:
+                self.cache_service.cache.set(cache_key, posts, expire=self.cache_ttl)
+            
+            return posts
         
-        return posts
+        return self._singleflight(cache_key, fetch)
 
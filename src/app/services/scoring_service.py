@@ -1,6 +1,7 @@
 import logging
 import math
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from ..config import cfg
@@ -13,6 +14,59 @@ _norm    = _scoring.get("normalize", {})
 _fb      = cfg.get("fallback_stats", {})
 
 
+def _keyword_re(words: list) -> "re.Pattern[str]":
+    """
+    Compile a case-insensitive pattern matching words that start with any keyword
+    
+    Inflections still match ("fracture" -> "fractured"), but a keyword
+    inside another word doesn't ("out" in "without").
+    """
+    if not words:
+        return re.compile(r"(?!)")
+    return re.compile(r"\b(?:" + "|".join(re.escape(w) for w in words) + r")\w*", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _title(name: str) -> str:
+    """Title-case a team name (cached; the set of team names is small)"""
+    return name.title()
+
+
+def _norm_range(stat: str, default_min: float, default_max: float) -> tuple:
+    """(min, max) normalization range for a stat from config"""
+    bounds = _norm.get(stat, {})
+    return bounds.get("min", default_min), bounds.get("max", default_max)
+
+
+def _weights(section: str, defaults: Dict[str, float]) -> Dict[str, float]:
+    """Stat weights from config, with every key filled in from defaults"""
+    configured = _scoring.get(section, {})
+    return {name: configured.get(name, default) for name, default in defaults.items()}
+
+
+# Normalization ranges and weights resolved once, not per scored team
+_SHOOTING_RANGE   = _norm_range("shooting_pct",     0.35,  0.55)
+_REBOUNDING_RANGE = _norm_range("rebounding_avg",   35.0,  50.0)
+_TURNOVERS_RANGE  = _norm_range("turnovers_avg",    12.0,  18.0)
+_NET_RATING_RANGE = _norm_range("net_rating_proxy", -10.0, 10.0)
+_ASSISTS_RANGE    = _norm_range("assists_avg",      20.0,  30.0)
+_WIN_PCT_RANGE    = _norm_range("win_pct",          0.25,  0.75)
+
+_WEIGHTS_WITH_WIN_PCT = _weights("weights_with_win_pct", {
+    "win_pct": 0.25, "net_rating": 0.22, "shooting": 0.18,
+    "assists": 0.12, "rebounding": 0.12, "turnovers": 0.11,
+})
+_WEIGHTS_NO_WIN_PCT = _weights("weights_no_win_pct", {
+    "net_rating": 0.28, "shooting": 0.22, "assists": 0.15,
+    "rebounding": 0.18, "turnovers": 0.17,
+})
+
+# Injury keyword patterns, shared with ProsConsService so both classify alike
+_inj = _scoring.get("injuries", {})
+_SIGNIFICANT_INJURY_RE = _keyword_re(_inj.get("significant_keywords", ['out', 'injured', 'surgery', 'fracture', 'torn']))
+_QUESTIONABLE_INJURY_RE = _keyword_re(_inj.get("questionable_keywords", ['questionable', 'doubtful', 'probable']))
+
+
 class ScoringService:
     """Service for calculating team scores and win probabilities"""
     
@@ -47,32 +101,31 @@ class ScoringService:
         win_pct          = stats.get('win_pct',          _fb.get("win_pct", 0.0))
 
         # Normalization ranges from config
-        nr = _norm
-        shooting_score    = self._normalize_stat(shooting_pct,     nr.get("shooting_pct",     {}).get("min", 0.35),  nr.get("shooting_pct",     {}).get("max", 0.55))
-        rebounding_score  = self._normalize_stat(rebounding_avg,   nr.get("rebounding_avg",   {}).get("min", 35.0),  nr.get("rebounding_avg",   {}).get("max", 50.0))
-        turnover_score    = 1.0 - self._normalize_stat(turnovers_avg, nr.get("turnovers_avg", {}).get("min", 12.0),  nr.get("turnovers_avg",    {}).get("max", 18.0))
-        net_rating_score  = self._normalize_stat(net_rating_proxy, nr.get("net_rating_proxy", {}).get("min", -10.0), nr.get("net_rating_proxy", {}).get("max", 10.0))
-        assists_score     = self._normalize_stat(assists_avg,      nr.get("assists_avg",      {}).get("min", 20.0),  nr.get("assists_avg",      {}).get("max", 30.0))
+        shooting_score    = self._normalize_stat(shooting_pct,     *_SHOOTING_RANGE)
+        rebounding_score  = self._normalize_stat(rebounding_avg,   *_REBOUNDING_RANGE)
+        turnover_score    = 1.0 - self._normalize_stat(turnovers_avg, *_TURNOVERS_RANGE)
+        net_rating_score  = self._normalize_stat(net_rating_proxy, *_NET_RATING_RANGE)
+        assists_score     = self._normalize_stat(assists_avg,      *_ASSISTS_RANGE)
 
         if win_pct > 0:
-            win_pct_score = self._normalize_stat(win_pct, nr.get("win_pct", {}).get("min", 0.25), nr.get("win_pct", {}).get("max", 0.75))
-            w = _scoring.get("weights_with_win_pct", {})
+            win_pct_score = self._normalize_stat(win_pct, *_WIN_PCT_RANGE)
+            w = _WEIGHTS_WITH_WIN_PCT
             stats_score = (
-                win_pct_score    * w.get("win_pct",    0.25) +
-                net_rating_score * w.get("net_rating", 0.22) +
-                shooting_score   * w.get("shooting",   0.18) +
-                assists_score    * w.get("assists",    0.12) +
-                rebounding_score * w.get("rebounding", 0.12) +
-                turnover_score   * w.get("turnovers",  0.11)
+                win_pct_score    * w["win_pct"] +
+                net_rating_score * w["net_rating"] +
+                shooting_score   * w["shooting"] +
+                assists_score    * w["assists"] +
+                rebounding_score * w["rebounding"] +
+                turnover_score   * w["turnovers"]
             )
         else:
-            w = _scoring.get("weights_no_win_pct", {})
+            w = _WEIGHTS_NO_WIN_PCT
             stats_score = (
-                net_rating_score * w.get("net_rating", 0.28) +
-                shooting_score   * w.get("shooting",   0.22) +
-                assists_score    * w.get("assists",    0.15) +
-                rebounding_score * w.get("rebounding", 0.18) +
-                turnover_score   * w.get("turnovers",  0.17)
+                net_rating_score * w["net_rating"] +
+                shooting_score   * w["shooting"] +
+                assists_score    * w["assists"] +
+                rebounding_score * w["rebounding"] +
+                turnover_score   * w["turnovers"]
             )
 
         return max(0.0, min(1.0, stats_score))
@@ -136,13 +189,12 @@ class ScoringService:
             return 0.0
         
         inj_cfg = _scoring.get("injuries", {})
-        keywords = inj_cfg.get("significant_keywords", ['out', 'injured', 'surgery', 'fracture'])
         per_injury = inj_cfg.get("penalty_per_injury", -0.05)
         penalty_max = inj_cfg.get("penalty_max", -0.15)
 
         significant_injuries = sum(
             1 for injury in injuries
-            if any(word in injury.lower() for word in keywords)
+            if _SIGNIFICANT_INJURY_RE.search(str(injury))
         )
         
         penalty = max(penalty_max, significant_injuries * per_injury)
@@ -167,12 +219,15 @@ class ScoringService:
         steepness: float | None = None
     ) -> float:
         """Calculate win probability for team1 using sigmoid"""
+        return self._win_probability_from_diff(team1_score - team2_score, steepness)
+    
+    def _win_probability_from_diff(self, score_diff: float, steepness: float | None = None) -> float:
+        """Win probability for team1 given a precomputed team1 - team2 score difference"""
         wp_cfg = _scoring.get("win_probability", {})
         if steepness is None:
             steepness = wp_cfg.get("sigmoid_steepness", 3.0)
         scale = wp_cfg.get("score_diff_scale", 2.0)
-        score_diff = (team1_score - team2_score) * scale
-        return self._sigmoid(score_diff, midpoint=0.0, steepness=steepness)
+        return self._sigmoid(score_diff * scale, midpoint=0.0, steepness=steepness)
     
     def _points_avg_for_breakdown(self, stats: Optional[Dict[str, Any]], default: float) -> float:
         """PPG for predicted final score; uses league-style default when missing or placeholder."""
@@ -197,6 +252,19 @@ class ScoringService:
         team2_stats: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Generate human-readable score breakdown"""
+        return self._score_breakdown_from_diff(
+            team1_score - team2_score, team1_name, team2_name, team1_stats, team2_stats
+        )
+    
+    def _score_breakdown_from_diff(
+        self,
+        score_diff: float,
+        team1_name: str,
+        team2_name: str,
+        team1_stats: Optional[Dict[str, Any]] = None,
+        team2_stats: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Score breakdown given a precomputed team1 - team2 score difference"""
         sb_cfg = _scoring.get("score_breakdown", {})
         base_score = float(sb_cfg.get("base_score", 110))
         margin_scale = sb_cfg.get("margin_scale", 20)
@@ -205,7 +273,6 @@ class ScoringService:
         ppg2 = self._points_avg_for_breakdown(team2_stats, base_score)
         center = (ppg1 + ppg2) / 2.0
 
-        score_diff = team1_score - team2_score
         score_margin = score_diff * margin_scale
         
         team1_points = center + score_margin
@@ -217,10 +284,7 @@ class ScoringService:
         elif team1_points == team2_points:
             team1_points += 1
         
-        team1_name_formatted = team1_name.title()
-        team2_name_formatted = team2_name.title()
-        
-        return f"Predicted final score: {team1_name_formatted} {int(team1_points)}-{int(team2_points)} {team2_name_formatted}"
+        return f"Predicted final score: {_title(team1_name)} {int(team1_points)}-{int(team2_points)} {_title(team2_name)}"
     
     def generate_confidence_label(self, win_probability: float) -> str:
         """Generate confidence label based on win probability"""
@@ -310,10 +374,6 @@ class ScoringService:
     
     def _extract_injury_factors(self, team1_injuries: Optional[list], team2_injuries: Optional[list]) -> Dict[str, Any]:
         """Extract injury factors for display"""
-        inj_cfg = _scoring.get("injuries", {})
-        sig_kw = inj_cfg.get("significant_keywords", ['out', 'injured', 'surgery', 'fracture', 'torn'])
-        q_kw = inj_cfg.get("questionable_keywords", ['questionable', 'doubtful', 'probable'])
-
         def parse_injuries(injuries: Optional[list]) -> Dict[str, Any]:
             if not injuries:
                 return {'count': 0, 'significant': 0, 'players': []}
@@ -322,11 +382,11 @@ class ScoringService:
             questionable = []
             
             for injury in injuries:
-                injury_lower = str(injury).lower()
-                if any(word in injury_lower for word in sig_kw):
-                    significant.append(str(injury))
-                elif any(word in injury_lower for word in q_kw):
-                    questionable.append(str(injury))
+                injury_str = str(injury)
+                if _SIGNIFICANT_INJURY_RE.search(injury_str):
+                    significant.append(injury_str)
+                elif _QUESTIONABLE_INJURY_RE.search(injury_str):
+                    questionable.append(injury_str)
             
             return {
                 'count': len(injuries),
@@ -367,7 +427,9 @@ class ScoringService:
         team1_score = self.calculate_team_score(team1_stats, team1_sentiment_tilt, team1_injuries_penalty)
         team2_score = self.calculate_team_score(team2_stats, team2_sentiment_tilt, team2_injuries_penalty)
         
-        win_probability = self.calculate_win_probability(team1_score, team2_score)
+        # Compute the score difference once; it drives both the probability and the breakdown
+        score_diff = team1_score - team2_score
+        win_probability = self._win_probability_from_diff(score_diff)
         wp_cfg = _scoring.get("win_probability", {})
         ph1 = (team1_stats or {}).get("data_source") == "placeholder"
         ph2 = (team2_stats or {}).get("data_source") == "placeholder"
@@ -384,8 +446,8 @@ class ScoringService:
 
         predicted_winner = team1_name if win_probability > 0.5 else team2_name
         
-        score_breakdown = self.generate_score_breakdown(
-            team1_score, team2_score, team1_name, team2_name,
+        score_breakdown = self._score_breakdown_from_diff(
+            score_diff, team1_name, team2_name,
             team1_stats=team1_stats,
             team2_stats=team2_stats,
         )
@@ -1,31 +1,107 @@
 import logging
 import re
-from typing import List, Dict, Any, Tuple
+import string
+from typing import List, Dict, Any, FrozenSet, Optional, Sequence, Tuple
 from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+import numpy as np
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 logger = logging.getLogger(__name__)
 
+def _strip_punc_if_word(token: str) -> str:
+    """Strip surrounding punctuation like VADER does, keeping short tokens (likely emoticons) intact"""
+    stripped = token.strip(string.punctuation)
+    return stripped if len(stripped) > 2 else token
+
+# Keyword tokens: alphanumeric + hyphens, at least 3 chars (applied to lowercased text)
+_WORD_RE = re.compile(r'\b[a-z0-9-]{3,}\b')
+
+# VADER expands each emoji into its description words, and its cost grows
+# quadratically with emoji-heavy input (seconds for one spam comment).
+# Bound what reaches it: cap each text, collapse long runs of the same
+# symbol (runs keep 4 chars, the most '!' VADER's emphasis counts) and keep
+# only the first MAX_SYMBOLS_PER_TEXT non-ASCII symbols (emoji and the like).
+MAX_TEXT_LEN = 2000
+MAX_SYMBOLS_PER_TEXT = 20
+_SYMBOL_RUN_RE = re.compile(r'([^\w\s])\1{4,}')
+_NON_ASCII_SYMBOL_RE = re.compile(r'[^\w\s\x00-\x7f]')
+
+
+def _sanitize_text(text: str) -> str:
+    """Bound a Reddit text before scoring (see MAX_TEXT_LEN)"""
+    text = _SYMBOL_RUN_RE.sub(r'\1\1\1\1', text[:MAX_TEXT_LEN * 2])[:MAX_TEXT_LEN]
+    if text.isascii():
+        return text
+    for count, match in enumerate(_NON_ASCII_SYMBOL_RE.finditer(text)):
+        if count == MAX_SYMBOLS_PER_TEXT:
+            cut = match.start()
+            return text[:cut] + _NON_ASCII_SYMBOL_RE.sub('', text[cut:])
+    return text
+
+
+@lru_cache(maxsize=1)
+def _get_shared_analyzer() -> SentimentIntensityAnalyzer:
+    """VADER analyzer shared by all services; loading its lexicons is the slow part"""
+    return SentimentIntensityAnalyzer()
+
+
+@dataclass(frozen=True)
+class SentimentResult:
+    """Scored Reddit texts shared by the summary and detailed formatters"""
+    texts: List[str]
+    avg_compound: float
+    pos_count: int
+    neu_count: int
+    neg_count: int
+    keywords: List[Tuple[str, int]]
+    positive_quotes: List[str]
+    negative_quotes: List[str]
+    
+    @property
+    def total(self) -> int:
+        return len(self.texts)
+
 
 class SentimentService:
     """Service for analyzing sentiment in Reddit text using VADER"""
     
+    # Common stopwords to filter from keywords (shared by all instances)
+    STOPWORDS: FrozenSet[str] = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+        'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
+        'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+        'me', 'him', 'her', 'us', 'them', 'what', 'which', 'who', 'whom',
+        'whose', 'where', 'when', 'why', 'how', 'all', 'each', 'every', 'both',
+        'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+        'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'now'
+    })
+    
     def __init__(self):
         """Initialize the sentiment service"""
         self.logger = logging.getLogger(__name__)
-        self.analyzer = SentimentIntensityAnalyzer()
-        # Common stopwords to filter from keywords
-        self.stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-            'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'me', 'him', 'her', 'us', 'them', 'what', 'which', 'who', 'whom',
-            'whose', 'where', 'when', 'why', 'how', 'all', 'each', 'every', 'both',
-            'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
-            'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'now'
-        }
+        # Read-only after construction, so one instance serves every service
+        self.analyzer = _get_shared_analyzer()
+        # Reddit threads repeat a lot of text (quotes, reposts, "this", "lol");
+        # memoize VADER so duplicates skip the lexicon walk. Only the compound
+        # score is used, so the cache holds floats rather than score dicts
+        self._compound = lru_cache(maxsize=4096)(self._compound_uncached)
+    
+    def _compound_uncached(self, text: str) -> float:
+        """Full VADER compound score for a single text"""
+        # All VADER valence comes from lexicon words (negation, boosters and
+        # punctuation only scale it), so ASCII text without a single lexicon
+        # token scores exactly 0. Non-ASCII text may hold emoji, which VADER
+        # expands into descriptive words first, so it always takes the full path.
+        if text.isascii() and self.analyzer.lexicon.keys().isdisjoint(
+            _strip_punc_if_word(token) for token in text.lower().split()
+        ):
+            return 0.0
+        return self.analyzer.polarity_scores(text)['compound']
     
     def _extract_text_from_reddit_data(self, reddit_posts: List[Dict[str, Any]]) -> List[str]:
         """
@@ -37,21 +113,29 @@ class SentimentService:
         Returns:
             List of text strings
         """
-        texts = []
-        for post in reddit_posts:
-            # Add post title and text
-            if post.get('title'):
-                texts.append(post['title'])
-            if post.get('text'):
-                texts.append(post['text'])
-            
-            # Add comments
-            if post.get('comments'):
-                for comment in post['comments']:
-                    if comment.get('text'):
-                        texts.append(comment['text'])
+        # Post title, post text, then each comment's text; empty and
+        # whitespace-only values skipped
+        return [
+            _sanitize_text(text)
+            for post in reddit_posts
+            for text in chain(
+                (post.get('title'), post.get('text')),
+                (comment.get('text') for comment in post.get('comments') or ())
+            )
+            if text and not text.isspace()
+        ]
+    
+    def _score_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Score each text with VADER, reusing results for previously seen texts
         
-        return texts
+        Args:
+            texts: List of text strings
+            
+        Returns:
+            Array of compound scores, one per text
+        """
+        return np.fromiter(map(self._compound, texts), dtype=np.float64, count=len(texts))
     
     def _calculate_keywords(self, texts: List[str], top_n: int = 10) -> List[Tuple[str, int]]:
         """
@@ -64,57 +148,112 @@ class SentimentService:
         Returns:
             List of (keyword, frequency) tuples
         """
-        # Combine all text
-        all_text = ' '.join(texts).lower()
-        
-        # Extract words (alphanumeric + hyphens, at least 3 chars)
-        words = re.findall(r'\b[a-z0-9-]{3,}\b', all_text)
-        
-        # Filter out stopwords and very short words
-        words = [w for w in words if w not in self.stopwords and len(w) >= 3]
+        # Tokenize text by text rather than joining and lowercasing the whole
+        # corpus at once, so no corpus-sized temporary strings are built
+        word_counts = Counter()
+        for text in texts:
+            # Extract words (alphanumeric + hyphens, at least 3 chars); counting
+            # the whole list runs in Counter's C loop
+            word_counts.update(_WORD_RE.findall(text.lower()))
         
-        # Count frequencies
-        word_counts = Counter(words)
+        # Drop stopwords once from the tally rather than testing every token
+        for stopword in self.STOPWORDS:
+            word_counts.pop(stopword, None)
         
         # Return top N keywords
         return word_counts.most_common(top_n)
     
-    def _get_sample_quotes(
+    def _get_sample_quotes_multi(
         self,
         texts: List[str],
-        sentiment_scores: List[Dict[str, float]],
-        sentiment_type: str,
-        max_quotes: int = 3
-    ) -> List[str]:
+        compounds: Sequence[float],
+        max_pos: int = 2,
+        max_neg: int = 2
+    ) -> Tuple[List[str], List[str]]:
         """
-        Get sample quotes of a specific sentiment type
+        Get the first positive and negative sample quotes
+        
+        Candidates are picked with vectorized masks over the compound
+        scores, keeping the texts' original order.
         
         Args:
             texts: List of text strings
-            sentiment_scores: List of sentiment score dictionaries
-            sentiment_type: 'pos', 'neg', or 'neu'
-            max_quotes: Maximum number of quotes to return
+            compounds: Compound score per text
+            max_pos: Maximum number of positive quotes
+            max_neg: Maximum number of negative quotes
             
         Returns:
-            List of quote strings
+            Tuple of (positive_quotes, negative_quotes)
         """
-        quotes = []
+        compounds = np.asarray(compounds, dtype=np.float64)
         
-        for text, scores in zip(texts, sentiment_scores):
-            compound = scores['compound']
-            
-            # Determine if this text matches the sentiment type
-            if sentiment_type == 'pos' and compound > 0.5:
-                quotes.append(text[:200])  # Limit quote length
-            elif sentiment_type == 'neg' and compound < -0.5:
-                quotes.append(text[:200])
-            elif sentiment_type == 'neu' and -0.1 <= compound <= 0.1:
-                quotes.append(text[:200])
+        # Limit quote length to 200 chars
+        positive_quotes = [texts[i][:200] for i in np.flatnonzero(compounds > 0.5)[:max_pos].tolist()]
+        negative_quotes = [texts[i][:200] for i in np.flatnonzero(compounds < -0.5)[:max_neg].tolist()]
+        
+        return positive_quotes, negative_quotes
+    
+    def _aggregate_scores(
+        self,
+        texts: List[str],
+        compounds: np.ndarray,
+        max_quotes: int
+    ) -> Tuple[float, int, int, int, List[str], List[str]]:
+        """
+        Aggregate sentiment scores: average, distribution and sample quotes
+        
+        Args:
+            texts: List of text strings
+            compounds: Array of compound scores, one per text
+            max_quotes: Maximum number of positive/negative quotes to collect
             
-            if len(quotes) >= max_quotes:
-                break
+        Returns:
+            Tuple of (avg_compound, pos_count, neu_count, neg_count,
+            positive_quotes, negative_quotes)
+        """
+        total = len(compounds)
+        avg_compound = float(compounds.mean()) if total else 0.0
+        pos_count = int(np.count_nonzero(compounds > 0.05))
+        neg_count = int(np.count_nonzero(compounds < -0.05))
+        neu_count = total - pos_count - neg_count
+        
+        positive_quotes, negative_quotes = self._get_sample_quotes_multi(
+            texts, compounds, max_pos=max_quotes, max_neg=max_quotes
+        )
         
-        return quotes
+        return avg_compound, pos_count, neu_count, neg_count, positive_quotes, negative_quotes
+    
+    def _compute(self, reddit_posts: List[Dict[str, Any]]) -> Optional[SentimentResult]:
+        """
+        Score Reddit posts once for both analyze entry points
+        
+        Collects the superset each formatter needs (top 10 keywords, up to
+        3 quotes per side); the summary formatter slices what it shows.
+        
+        Args:
+            reddit_posts: List of Reddit post dictionaries from RedditService
+            
+        Returns:
+            SentimentResult, or None if the posts contain no text
+        """
+        texts = self._extract_text_from_reddit_data(reddit_posts)
+        if not texts:
+            return None
+        
+        compounds = self._score_texts(texts)
+        (avg_compound, pos_count, neu_count, neg_count,
+         positive_quotes, negative_quotes) = self._aggregate_scores(texts, compounds, max_quotes=3)
+        
+        return SentimentResult(
+            texts=texts,
+            avg_compound=avg_compound,
+            pos_count=pos_count,
+            neu_count=neu_count,
+            neg_count=neg_count,
+            keywords=self._calculate_keywords(texts, top_n=10),
+            positive_quotes=positive_quotes,
+            negative_quotes=negative_quotes
+        )
     
     def analyze_sentiment(self, reddit_posts: List[Dict[str, Any]]) -> str:
         """
@@ -129,38 +268,20 @@ class SentimentService:
         if not reddit_posts:
             return "No Reddit data available - sentiment analysis unavailable for this team. This may be due to team/subreddit mapping or temporary Reddit API issues."
         
-        # Extract all text
-        texts = self._extract_text_from_reddit_data(reddit_posts)
+        result = self._compute(reddit_posts)
         
-        if not texts:
+        if result is None:
             return "No text content found in Reddit data - sentiment analysis unavailable."
         
-        # Analyze sentiment for each text
-        sentiment_scores = []
-        for text in texts:
-            scores = self.analyzer.polarity_scores(text)
-            sentiment_scores.append(scores)
-        
-        # Calculate average compound score
-        avg_compound = sum(s['compound'] for s in sentiment_scores) / len(sentiment_scores)
-        
-        # Calculate distribution
-        pos_count = sum(1 for s in sentiment_scores if s['compound'] > 0.05)
-        neg_count = sum(1 for s in sentiment_scores if s['compound'] < -0.05)
-        neu_count = len(sentiment_scores) - pos_count - neg_count
-        total = len(sentiment_scores)
+        avg_compound = result.avg_compound
+        total = result.total
+        pos_pct = (result.pos_count / total * 100) if total > 0 else 0
+        neg_pct = (result.neg_count / total * 100) if total > 0 else 0
+        neu_pct = (result.neu_count / total * 100) if total > 0 else 0
         
-        pos_pct = (pos_count / total * 100) if total > 0 else 0
-        neg_pct = (neg_count / total * 100) if total > 0 else 0
-        neu_pct = (neu_count / total * 100) if total > 0 else 0
-        
-        # Get top keywords
-        keywords = self._calculate_keywords(texts, top_n=5)
-        keyword_list = [kw[0] for kw in keywords]
-        
-        # Get sample quotes
-        positive_quotes = self._get_sample_quotes(texts, sentiment_scores, 'pos', max_quotes=2)
-        negative_quotes = self._get_sample_quotes(texts, sentiment_scores, 'neg', max_quotes=2)
+        keyword_list = [kw[0] for kw in result.keywords[:5]]
+        positive_quotes = result.positive_quotes
+        negative_quotes = result.negative_quotes
         
         # Build summary string
         summary_parts = []
@@ -218,9 +339,9 @@ class SentimentService:
                 'negative_quotes': []
             }
         
-        texts = self._extract_text_from_reddit_data(reddit_posts)
+        result = self._compute(reddit_posts)
         
-        if not texts:
+        if result is None:
             return {
                 'avg_compound': 0.0,
                 'distribution': {'pos': 0, 'neu': 0, 'neg': 0},
@@ -229,29 +350,19 @@ class SentimentService:
                 'negative_quotes': []
             }
         
-        sentiment_scores = [self.analyzer.polarity_scores(text) for text in texts]
-        avg_compound = sum(s['compound'] for s in sentiment_scores) / len(sentiment_scores)
-        
-        pos_count = sum(1 for s in sentiment_scores if s['compound'] > 0.05)
-        neg_count = sum(1 for s in sentiment_scores if s['compound'] < -0.05)
-        neu_count = len(sentiment_scores) - pos_count - neg_count
-        
-        keywords = self._calculate_keywords(texts, top_n=10)
-        positive_quotes = self._get_sample_quotes(texts, sentiment_scores, 'pos', max_quotes=3)
-        negative_quotes = self._get_sample_quotes(texts, sentiment_scores, 'neg', max_quotes=3)
-        
+        total = result.total
         return {
-            'avg_compound': round(avg_compound, 3),
+            'avg_compound': round(result.avg_compound, 3),
             'distribution': {
-                'pos': pos_count,
-                'neu': neu_count,
-                'neg': neg_count,
-                'pos_pct': round(pos_count / len(sentiment_scores) * 100, 1),
-                'neu_pct': round(neu_count / len(sentiment_scores) * 100, 1),
-                'neg_pct': round(neg_count / len(sentiment_scores) * 100, 1)
+                'pos': result.pos_count,
+                'neu': result.neu_count,
+                'neg': result.neg_count,
+                'pos_pct': round(result.pos_count / total * 100, 1),
+                'neu_pct': round(result.neu_count / total * 100, 1),
+                'neg_pct': round(result.neg_count / total * 100, 1)
             },
-            'keywords': [{'word': kw[0], 'frequency': kw[1]} for kw in keywords],
-            'positive_quotes': positive_quotes,
-            'negative_quotes': negative_quotes
+            'keywords': [{'word': kw[0], 'frequency': kw[1]} for kw in result.keywords],
+            'positive_quotes': result.positive_quotes,
+            'negative_quotes': result.negative_quotes
         }
 
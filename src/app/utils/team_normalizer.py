@@ -1,9 +1,56 @@
 """Team name normalization utility"""
 import logging
-from typing import Dict, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Tokens too generic to identify a team on their own
+_INDEX_STOPWORDS = frozenset({"the", "of"})
+
+
+def _build_token_index(team_map: Dict[str, str]) -> Dict[str, str]:
+    """
+    Map every distinctive token of the team map keys to its team.
+
+    Tokens shared by more than one team ("los", "la", "new", ...) are
+    left out, so any hit in the index is unambiguous.
+    """
+    index: Dict[str, str] = {}
+    ambiguous = set()
+    for key, value in team_map.items():
+        for token in _TOKEN_RE.findall(key):
+            if token in _INDEX_STOPWORDS or token in ambiguous:
+                continue
+            if index.setdefault(token, value) != value:
+                ambiguous.add(token)
+                del index[token]
+    return index
+
+
+def _build_prefix_index(team_map: Dict[str, str], min_len: int = 3) -> Dict[str, str]:
+    """
+    Map every proper prefix (at least min_len chars) of the team map key
+    tokens to its team, for truncated inputs like "warrior" or "grizz".
+
+    Prefixes shared by more than one team are left out.
+    """
+    teams_by_prefix: Dict[str, Set[str]] = {}
+    for key, value in team_map.items():
+        for token in _TOKEN_RE.findall(key):
+            if token in _INDEX_STOPWORDS:
+                continue
+            for end in range(min_len, len(token)):
+                teams_by_prefix.setdefault(token[:end], set()).add(value)
+    return {
+        prefix: next(iter(teams))
+        for prefix, teams in teams_by_prefix.items()
+        if len(teams) == 1
+    }
+
 
 class TeamNormalizer:
     """Normalizes team names from short/nickname forms to full official names"""
@@ -209,6 +256,12 @@ class TeamNormalizer:
         "hou": "Houston Rockets",
     }
     
+    # Distinctive token -> team, built once at class creation for partial matches
+    _TOKEN_INDEX: Dict[str, str] = _build_token_index(TEAM_NAME_MAP)
+    
+    # Unambiguous token prefix -> team, for truncated inputs ("sixer", "cav")
+    _PREFIX_INDEX: Dict[str, str] = _build_prefix_index(TEAM_NAME_MAP)
+    
     @classmethod
     def normalize(cls, team_name: str) -> str:
         """
@@ -222,25 +275,33 @@ class TeamNormalizer:
         """
         if not team_name:
             return team_name
-        
+        return cls._normalize_cached(team_name)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _normalize_cached(cls, team_name: str) -> str:
+        """Memoized body of normalize; callers repeat the same few names"""
         team_name_lower = team_name.lower().strip()
         
         # Check if exact match exists
         if team_name_lower in cls.TEAM_NAME_MAP:
             normalized = cls.TEAM_NAME_MAP[team_name_lower]
-            logger.debug(f"Normalized '{team_name}' -> '{normalized}'")
+            logger.debug("Normalized '%s' -> '%s'", team_name, normalized)
             return normalized
         
-        # Try partial matching for edge cases
-        # Check if any key in the map contains the input or vice versa
-        for key, value in cls.TEAM_NAME_MAP.items():
-            if team_name_lower in key or key in team_name_lower:
-                normalized = value
-                logger.debug(f"Normalized '{team_name}' -> '{normalized}' (partial match)")
-                return normalized
+        # Try partial matching for edge cases: the first input token that
+        # identifies a single team wins (e.g. "the lakers", "Warriors fans"),
+        # then the first that is an unambiguous prefix of one ("Sixer", "grizz")
+        tokens = _TOKEN_RE.findall(team_name_lower)
+        for index in (cls._TOKEN_INDEX, cls._PREFIX_INDEX):
+            for token in tokens:
+                normalized = index.get(token)
+                if normalized:
+                    logger.debug("Normalized '%s' -> '%s' (partial match)", team_name, normalized)
+                    return normalized
         
         # If no match found, return original (case-preserved, but trimmed)
-        logger.debug(f"No normalization found for '{team_name}', returning as-is")
+        logger.debug("No normalization found for '%s', returning as-is", team_name)
         return team_name.strip()
     
     @classmethod
@@ -1,3 +1,5 @@
+import math
+import diskcache
 import pytest
 import tempfile
 import shutil
@@ -15,9 +17,15 @@ def temp_cache_dir():
 
 
 @pytest.fixture
-def cache_service(temp_cache_dir):
-    """Create a cache service instance for testing"""
-    return CacheService(cache_dir=temp_cache_dir, default_ttl=60)
+def cache_service():
+    """Create an in-memory cache service instance for testing"""
+    return CacheService(default_ttl=60, backend="memory")
+
+
+@pytest.fixture
+def disk_cache_service(temp_cache_dir):
+    """Create a diskcache-backed cache service for disk-specific tests"""
+    return CacheService(cache_dir=temp_cache_dir, default_ttl=60, backend="disk")
 
 
 def test_cache_miss(cache_service):
@@ -88,22 +96,30 @@ def test_cache_delete(cache_service):
     assert cache_service.get("basketball", "Lakers", "Warriors") is None
 
 
-def test_cache_ttl_expiration(cache_service):
+def test_cache_ttl_expiration(disk_cache_service):
     """Test that cache entries expire after TTL"""
     test_value = {"test": "data"}
     
     # Set with very short TTL (1 second)
-    cache_service.set("basketball", "Lakers", "Warriors", test_value, ttl=1)
+    disk_cache_service.set("basketball", "Lakers", "Warriors", test_value, ttl=1)
     
     # Should be available immediately
-    assert cache_service.get("basketball", "Lakers", "Warriors") == test_value
+    assert disk_cache_service.get("basketball", "Lakers", "Warriors") == test_value
     
     # Wait for expiration
     import time
     time.sleep(2)
     
     # Should be expired
+    assert disk_cache_service.get("basketball", "Lakers", "Warriors") is None
+
+
+def test_memory_backend_expiry(cache_service):
+    """Test that the in-memory backend drops entries once their TTL has passed"""
+    cache_service.set("basketball", "Lakers", "Warriors", {"test": "data"}, ttl=0)
+    
     assert cache_service.get("basketball", "Lakers", "Warriors") is None
+    assert cache_service.backend.clear() == 0
 
 
 def test_cache_with_pydantic_model(cache_service):
@@ -146,3 +162,93 @@ def test_cache_with_pydantic_model(cache_service):
     assert cached.matchup.predicted_winner == "Lakers"
     assert cached.matchup.win_probability == 0.65
 
+
+
+def test_cache_serialization_codecs(disk_cache_service):
+    """Test that JSON-friendly values skip pickle and other values still round-trip"""
+    posts = [{"title": "Game thread", "score": 12, "comments": []}]
+    disk_cache_service.set("basketball", "Lakers", "Warriors", posts)
+    
+    key = disk_cache_service._generate_key("basketball", "Lakers", "Warriors")
+    assert disk_cache_service.backend.cache.get(key)[:1] == b"J"
+    assert disk_cache_service.get("basketball", "Lakers", "Warriors") == posts
+    
+    pair = ("Lakers", {"wins": 10})
+    disk_cache_service.set("basketball", "Celtics", "Heat", pair)
+    assert disk_cache_service.get("basketball", "Celtics", "Heat") == pair
+
+
+def test_cache_lossy_json_values_use_pickle(disk_cache_service):
+    """Test that dicts JSON would alter (NaN, nested tuples) read back unchanged from disk"""
+    stats = {"ppg": float("nan"), "pair": ("a", 1)}
+    disk_cache_service.set("basketball", "Lakers", "Warriors", stats)
+    
+    key = disk_cache_service._generate_key("basketball", "Lakers", "Warriors")
+    assert disk_cache_service.backend.cache.get(key)[:1] == b"K"
+    
+    # Read through the backend to bypass the in-process layer
+    cached = disk_cache_service.backend.get(key)
+    assert math.isnan(cached["ppg"])
+    assert cached["pair"] == ("a", 1)
+
+
+def test_cache_in_process_layer(cache_service):
+    """Test that repeat gets are served in-process and writes keep it coherent"""
+    cache_service.set("basketball", "Lakers", "Warriors", {"test": "data"})
+    
+    cache_service.backend.get = lambda key: pytest.fail("backend read on in-process hit")
+    assert cache_service.get("basketball", "Lakers", "Warriors") == {"test": "data"}
+    
+    cache_service.set("basketball", "Lakers", "Warriors", {"test": "updated"})
+    assert cache_service.get("basketball", "Lakers", "Warriors") == {"test": "updated"}
+    
+    cache_service.delete("basketball", "Lakers", "Warriors")
+    del cache_service.backend.get
+    assert cache_service.get("basketball", "Lakers", "Warriors") is None
+
+
+def test_disk_cache_is_bounded(disk_cache_service):
+    """Test that the disk backend is capped below diskcache's default and keeps read-only gets"""
+    disk = disk_cache_service.backend.cache
+    assert 0 < disk.size_limit < diskcache.DEFAULT_SETTINGS["size_limit"]
+    assert disk.eviction_policy == "least-recently-stored"
+
+
+def test_cache_trusted_model_skips_validation(disk_cache_service, monkeypatch):
+    """Test that registered models are rebuilt with model_construct, nested models included"""
+    response = CompareResponse(
+        team1=TeamAnalysis(pros=["a"], cons=["b"], stats_summary="s1", sentiment_summary="m1"),
+        team2=TeamAnalysis(pros=["c"], cons=[], stats_summary="s2", sentiment_summary="m2"),
+        matchup=MatchupAnalysis(
+            predicted_winner="Lakers",
+            win_probability=0.6,
+            score_breakdown="110-105",
+            confidence_label="Moderate",
+            prediction_factors={"home_court": 0.03}
+        ),
+        sources=Sources(reddit=[], stats=["http://example.com/stats"])
+    )
+    disk_cache_service.set("basketball", "Lakers", "Warriors", response)
+    disk_cache_service._l1.clear()
+    
+    def fail_validate(*args, **kwargs):
+        pytest.fail("model_validate called for a trusted model")
+    monkeypatch.setattr(CompareResponse, "model_validate", fail_validate)
+    
+    cached = disk_cache_service.get("basketball", "Lakers", "Warriors")
+    
+    assert isinstance(cached.team1, TeamAnalysis)
+    assert isinstance(cached.matchup, MatchupAnalysis)
+    assert cached.model_dump() == response.model_dump()
+
+
+def test_cache_untrusted_model_round_trip(disk_cache_service):
+    """Test that unregistered models are validated back from their JSON payload"""
+    context = Context(injuries=["Player X - out"], gameDate="2024-01-15")
+    disk_cache_service.set("basketball", "Lakers", "Warriors", context)
+    disk_cache_service._l1.clear()
+    
+    cached = disk_cache_service.get("basketball", "Lakers", "Warriors")
+    
+    assert isinstance(cached, Context)
+    assert cached == context
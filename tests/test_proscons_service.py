@@ -101,6 +101,10 @@ def test_generate_cons_from_injuries(proscons_service):
     injuries_multi = ["Player X - out", "Player Y - injured"]
     cons_multi = proscons_service._generate_cons_from_injuries(injuries_multi)
     assert len(cons_multi) > 0
+    
+    # Same significance rules as the injury penalty in ScoringService
+    assert proscons_service._generate_cons_from_injuries(["Fractured wrist"])[0].startswith("Key player injury")
+    assert proscons_service._generate_cons_from_injuries(["Played without restriction"])[0].startswith("Injury concerns")
 
 
 def test_generate_pros_cons(proscons_service, sample_stats):
@@ -1,7 +1,9 @@
+import json
 import pytest
 import os
 from unittest.mock import Mock, patch, MagicMock
-from src.app.services.reddit_service import RedditService
+from src.app.services.reddit_service import RedditService, _extract_post_id
+from src.app.services.async_reddit_service import AsyncRedditService
 
 
 @pytest.fixture
@@ -106,11 +108,107 @@ def test_get_team_subreddit(reddit_service):
     assert reddit_service._get_team_subreddit("Unknown Team") is None
 
 
+def test_get_team_subreddit_aliases(reddit_service):
+    """Test subreddit lookup for aliases, casing and stray whitespace"""
+    assert reddit_service._get_team_subreddit("LA Lakers") == "lakers"
+    assert reddit_service._get_team_subreddit("  los angeles LAKERS ") == "lakers"
+    assert reddit_service._get_team_subreddit("Sixers") == "sixers"
+    assert reddit_service._get_team_subreddit("OKC") == "thunder"
+
+
+def test_async_service_shares_alias_lookup():
+    """Test that the async service used by /compare resolves the same aliases"""
+    async_service = AsyncRedditService()
+    assert async_service._get_team_subreddit("LA Lakers") == "lakers"
+    assert async_service._get_team_subreddit("Sixers") == "sixers"
+    assert async_service._get_team_subreddit("OKC") == "thunder"
+    assert async_service._get_team_subreddit("Unknown Team") is None
+
+
+def test_async_fetch_team_posts_with_cache_service():
+    """Test async team fetches against a real CacheService: aliases hit one entry, empty results aren't cached"""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from src.app.services.cache_service import CacheService
+    
+    async_service = AsyncRedditService(cache_service=CacheService(backend="memory"))
+    posts = [{'title': 'Post 1', 'url': 'https://www.reddit.com/r/lakers/comments/abc123/post/'}]
+    
+    with patch.object(async_service, '_fetch_posts_json', AsyncMock(return_value=posts)) as mock_fetch:
+        assert asyncio.run(async_service.fetch_team_posts("LA Lakers", include_comments=False)) == posts
+        assert asyncio.run(async_service.fetch_team_posts("la lakers ", include_comments=False)) == posts
+    mock_fetch.assert_awaited_once_with('lakers', limit=10)
+    
+    with patch.object(async_service, '_fetch_posts_json', AsyncMock(return_value=[])) as mock_fetch:
+        assert asyncio.run(async_service.fetch_team_posts("Celtics", include_comments=False)) == []
+        assert asyncio.run(async_service.fetch_team_posts("Celtics", include_comments=False)) == []
+    assert mock_fetch.await_count == 2
+
+
+def test_async_service_reuses_pooled_client_on_app_loop():
+    """Test the /compare-style path: cached service, one loop, one pooled client closed on shutdown"""
+    import asyncio
+    import httpx
+    from src.app.services.cache_service import CacheService
+    
+    listing = {'data': {'children': [{'data': {'title': 'Post', 'permalink': '/r/lakers/comments/abc123/post/'}}]}}
+    async_service = AsyncRedditService(cache_service=CacheService(backend="memory"), max_retries=1)
+    clients = []
+    
+    def new_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=listing)))
+        clients.append(client)
+        return client
+    
+    async def compare_requests():
+        team1 = await async_service.fetch_team_posts("Lakers", include_comments=False)
+        team2 = await async_service.fetch_team_posts("Celtics", include_comments=False)
+        pooled = async_service._client
+        await async_service.aclose()  # app lifespan shutdown
+        return team1, team2, pooled
+    
+    with patch.object(async_service, '_new_client', side_effect=new_client):
+        team1, team2, pooled = asyncio.run(compare_requests())
+    
+    assert team1[0]['title'] == team2[0]['title'] == 'Post'
+    assert clients == [pooled]
+    assert pooled.is_closed
+
+
+def test_deprecated_sync_wrapper_closes_its_clients():
+    """Test that each blocking call closes the HTTP client it opened on its own loop"""
+    import httpx
+    from src.app.services import async_reddit_service
+    
+    with pytest.warns(DeprecationWarning):
+        wrapper = async_reddit_service.RedditService(max_retries=1)
+    clients = []
+    
+    def new_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+        clients.append(client)
+        return client
+    
+    with patch.object(wrapper._async_service, '_new_client', side_effect=new_client):
+        assert wrapper.fetch_nba_posts(limit=5, include_comments=False) == []
+        assert wrapper.fetch_nba_posts(limit=6, include_comments=False) == []
+    
+    assert len(clients) == 2
+    assert all(client.is_closed for client in clients)
+
+
+def test_extract_post_id():
+    """Test extracting post IDs from Reddit post URLs"""
+    assert _extract_post_id('https://www.reddit.com/r/lakers/comments/abc123/test_post/') == 'abc123'
+    assert _extract_post_id('http://example.com/1') is None
+
+
 def test_fetch_json_endpoint_success(reddit_service, mock_reddit_json_response):
     """Test successful JSON endpoint fetch"""
     with patch.object(reddit_service.session, 'get') as mock_get:
         mock_response = MagicMock()
         mock_response.json.return_value = mock_reddit_json_response
+        mock_response.content = json.dumps(mock_reddit_json_response).encode()
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
         
@@ -198,9 +296,25 @@ def test_fetch_team_posts_cache_miss(reddit_service, cache_service_mock, mock_re
 
 def test_fetch_team_posts_no_subreddit(reddit_service, cache_service_mock):
     """Test fetching team posts when team has no subreddit mapping"""
-    posts = reddit_service.fetch_team_posts("Unknown Team")
+    with patch.object(reddit_service, '_fetch_with_comments') as mock_fetch:
+        posts = reddit_service.fetch_team_posts("Unknown Team")
+    
+    assert posts == []
+    mock_fetch.assert_not_called()
+    cache_service_mock.cache.get.assert_not_called()
+    cache_service_mock.cache.set.assert_not_called()
+
+
+def test_fetch_team_posts_cached_empty_result(reddit_service, cache_service_mock):
+    """Test that a cached empty result for a known team short-circuits the fetch"""
+    cache_service_mock.cache.get.return_value = []
+    
+    with patch.object(reddit_service, '_fetch_with_comments') as mock_fetch:
+        posts = reddit_service.fetch_team_posts("Lakers")
     
     assert posts == []
+    mock_fetch.assert_not_called()
+    cache_service_mock.cache.set.assert_not_called()
 
 
 def test_fetch_nba_posts_cache_hit(reddit_service, cache_service_mock):
@@ -226,6 +340,19 @@ def test_fetch_nba_posts_cache_miss(reddit_service, cache_service_mock, mock_red
         cache_service_mock.cache.set.assert_called()
 
 
+def test_fetch_nba_posts_empty_result_not_cached(reddit_service, cache_service_mock):
+    """Test that a cached empty r/nba result is a hit and a failed fetch isn't cached"""
+    cache_service_mock.cache.get.return_value = []
+    with patch.object(reddit_service, '_fetch_with_comments') as mock_fetch:
+        assert reddit_service.fetch_nba_posts(limit=25) == []
+    mock_fetch.assert_not_called()
+    
+    cache_service_mock.cache.get.return_value = None
+    with patch.object(reddit_service, '_fetch_with_comments', return_value=[]):
+        assert reddit_service.fetch_nba_posts(limit=25) == []
+    cache_service_mock.cache.set.assert_not_called()
+
+
 def test_fetch_team_posts_with_comments(reddit_service, cache_service_mock, mock_reddit_json_response, mock_comments_json_response):
     """Test fetching team posts with comments"""
     cache_service_mock.cache.get.return_value = None
@@ -249,6 +376,57 @@ def test_fetch_team_posts_with_comments(reddit_service, cache_service_mock, mock
             assert 'comments' in posts[0] or len(posts[0].get('comments', [])) >= 0
 
 
+def test_fetch_team_posts_comments_match_posts(reddit_service, cache_service_mock):
+    """Test that concurrently fetched comments are attached to the right posts"""
+    cache_service_mock.cache.get.return_value = None
+    
+    mock_posts = [
+        {'title': f'Post {i}', 'url': f'https://www.reddit.com/r/lakers/comments/id{i}/post_{i}/'}
+        for i in range(6)
+    ]
+    
+    def fake_comments(post_id):
+        return [{'text': f'Comment on {post_id}'}]
+    
+    with patch.object(reddit_service, '_fetch_posts_json', return_value=mock_posts):
+        with patch.object(reddit_service, '_fetch_comments_json', side_effect=fake_comments):
+            posts = reddit_service.fetch_team_posts("Los Angeles Lakers", include_comments=True)
+    
+    for i, post in enumerate(posts[:5]):
+        assert post['comments'] == [{'text': f'Comment on id{i}'}]
+    assert 'comments' not in posts[5]
+
+
+def test_fetch_team_posts_concurrent_misses_share_fetch(reddit_service, cache_service_mock):
+    """Test that concurrent cache misses for the same team trigger a single fetch"""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    
+    all_missed = threading.Barrier(4)
+    
+    def cache_miss(key):
+        all_missed.wait(timeout=5)
+        return None
+    
+    cache_service_mock.cache.get.side_effect = cache_miss
+    calls = []
+    
+    def slow_fetch(subreddit, limit, include_comments):
+        calls.append(subreddit)
+        time.sleep(0.2)  # Let the other callers join the in-flight fetch
+        return [{'title': 'Post 1', 'url': 'http://example.com/1'}]
+    
+    with patch.object(reddit_service, '_fetch_with_comments', side_effect=slow_fetch):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(reddit_service.fetch_team_posts, "Los Angeles Lakers") for _ in range(4)]
+            results = [f.result() for f in futures]
+    
+    assert calls == ['lakers']
+    assert all(r == results[0] for r in results)
+    assert not reddit_service._inflight
+
+
 def test_praw_initialization_with_creds(monkeypatch):
     """Test PRAW initialization with credentials"""
     monkeypatch.setenv('REDDIT_CLIENT_ID', 'test_client_id')
@@ -283,3 +461,14 @@ def test_session_headers(reddit_service):
     assert 'User-Agent' in reddit_service.session.headers
     assert 'BallPulse' in reddit_service.session.headers['User-Agent']
 
+
+
+def test_session_shared_across_instances(reddit_service):
+    """Test that instances with the same retry policy reuse one pooled session"""
+    assert RedditService(max_retries=2).session is reddit_service.session
+    assert RedditService(max_retries=1).session is not reddit_service.session
+
+
+def test_io_pool_shared_across_instances(reddit_service):
+    """Test that instances share one comment-fetch worker pool instead of each owning threads"""
+    assert RedditService(max_retries=1)._io_pool is reddit_service._io_pool
@@ -131,6 +131,11 @@ def test_calculate_injuries_penalty(scoring_service):
     penalty_multi = scoring_service.calculate_injuries_penalty(injuries_multi)
     assert penalty_multi <= -0.05
     assert penalty_multi >= -0.15
+    
+    # Keywords match at word starts, inflections included ("without" is not "out")
+    penalty_none_sig = scoring_service.calculate_injuries_penalty(["Played without restriction"])
+    assert penalty_none_sig == 0.0
+    assert scoring_service.calculate_injuries_penalty(["Fractured wrist"]) == -0.05
 
 
 def test_calculate_team_score(scoring_service, sample_stats):
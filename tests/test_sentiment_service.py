@@ -1,17 +1,26 @@
+from types import MappingProxyType
+import numpy as np
 import pytest
 from src.app.services.sentiment_service import SentimentService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentiment_service():
-    """Create a SentimentService instance for testing"""
+    """Create a SentimentService instance shared by all tests (tests only read from it)"""
     return SentimentService()
 
 
-@pytest.fixture
+def _freeze_post(post):
+    """Read-only view of a post and its comments, so shared fixture data can't be mutated"""
+    frozen = dict(post)
+    frozen['comments'] = tuple(MappingProxyType(comment) for comment in post.get('comments', ()))
+    return MappingProxyType(frozen)
+
+
+@pytest.fixture(scope="module")
 def sample_reddit_posts():
-    """Sample Reddit posts data for testing"""
-    return [
+    """Sample Reddit posts data for testing (built once per module, read-only)"""
+    posts = [
         {
             'title': 'Lakers are playing amazing basketball this season!',
             'text': 'The team has been on fire lately. Great defense and offense.',
@@ -67,6 +76,7 @@ def sample_reddit_posts():
             ]
         }
     ]
+    return tuple(_freeze_post(post) for post in posts)
 
 
 def test_analyze_sentiment_with_data(sentiment_service, sample_reddit_posts):
@@ -103,6 +113,14 @@ def test_analyze_sentiment_empty_text(sentiment_service):
     assert "No text content" in summary
 
 
+def test_analyze_sentiment_whitespace_only_text(sentiment_service):
+    """Test that whitespace-only titles and comments count as no text"""
+    posts = [{'title': '  ', 'text': '\n\t', 'comments': [{'text': '   '}]}]
+    
+    assert sentiment_service._extract_text_from_reddit_data(posts) == []
+    assert "No text content" in sentiment_service.analyze_sentiment(posts)
+
+
 def test_analyze_sentiment_detailed(sentiment_service, sample_reddit_posts):
     """Test detailed sentiment analysis"""
     result = sentiment_service.analyze_sentiment_detailed(sample_reddit_posts)
@@ -156,6 +174,32 @@ def test_extract_text_from_reddit_data(sentiment_service, sample_reddit_posts):
     assert any('amazing' in text for text in texts)
 
 
+def test_extract_text_bounds_pathological_input(sentiment_service):
+    """Test that symbol/emoji spam is collapsed and long texts are capped"""
+    from src.app.services.sentiment_service import MAX_TEXT_LEN
+    
+    posts = [{'title': 'Wow' + '\U0001F600' * 5000, 'text': 'Great!!!!!!!!', 'comments': [{'text': 'x' * 10000}]}]
+    
+    texts = sentiment_service._extract_text_from_reddit_data(posts)
+    
+    assert texts[0] == 'Wow' + '\U0001F600' * 4
+    assert texts[1] == 'Great!!!!'
+    assert len(texts[2]) == MAX_TEXT_LEN
+
+
+def test_extract_text_bounds_mixed_emoji(sentiment_service):
+    """Test that alternating emoji spam is cut to the per-text symbol budget"""
+    from src.app.services.sentiment_service import MAX_SYMBOLS_PER_TEXT
+    
+    posts = [{'title': 'Wow \U0001F600\U0001F602' * 2500, 'text': 'Go Lakers \U0001F3C0', 'comments': []}]
+    
+    texts = sentiment_service._extract_text_from_reddit_data(posts)
+    
+    assert sum(not ch.isascii() for ch in texts[0]) == MAX_SYMBOLS_PER_TEXT
+    assert texts[0].startswith('Wow \U0001F600\U0001F602Wow')
+    assert texts[1] == 'Go Lakers \U0001F3C0'
+
+
 def test_calculate_keywords(sentiment_service):
     """Test keyword extraction"""
     texts = [
@@ -182,13 +226,9 @@ def test_get_sample_quotes_positive(sentiment_service):
         'Terrible game, worst performance ever.'
     ]
     
-    sentiment_scores = [
-        {'compound': 0.8},  # Very positive
-        {'compound': 0.7},  # Positive
-        {'compound': -0.9}  # Very negative
-    ]
+    compounds = [0.8, 0.7, -0.9]  # Very positive, positive, very negative
     
-    quotes = sentiment_service._get_sample_quotes(texts, sentiment_scores, 'pos', max_quotes=2)
+    quotes, _ = sentiment_service._get_sample_quotes_multi(texts, compounds, max_pos=2, max_neg=0)
     
     assert isinstance(quotes, list)
     assert len(quotes) <= 2
@@ -204,38 +244,56 @@ def test_get_sample_quotes_negative(sentiment_service):
         'Awful defense and bad coaching.'
     ]
     
-    sentiment_scores = [
-        {'compound': 0.8},  # Very positive
-        {'compound': 0.7},  # Positive
-        {'compound': -0.9},  # Very negative
-        {'compound': -0.8}   # Very negative
-    ]
+    compounds = [0.8, 0.7, -0.9, -0.8]  # Two positive, two very negative
     
-    quotes = sentiment_service._get_sample_quotes(texts, sentiment_scores, 'neg', max_quotes=2)
+    _, quotes = sentiment_service._get_sample_quotes_multi(texts, compounds, max_pos=0, max_neg=2)
     
     assert isinstance(quotes, list)
     assert len(quotes) <= 2
     assert len(quotes) >= 1  # Should find at least one negative quote
 
 
-def test_get_sample_quotes_neutral(sentiment_service):
-    """Test getting neutral sample quotes"""
+def test_get_sample_quotes_skips_neutral(sentiment_service):
+    """Test that neutral and mildly scored texts are never picked as quotes"""
     texts = [
         'The score is 100-95.',
         'Game starts at 8pm.',
+        'Decent effort.',
         'This is amazing!'
     ]
     
-    sentiment_scores = [
-        {'compound': 0.0},   # Neutral
-        {'compound': -0.05}, # Neutral (just below threshold)
-        {'compound': 0.8}    # Positive
-    ]
+    compounds = [0.0, -0.05, 0.4, 0.8]  # Neutral, neutral, mild, positive
     
-    quotes = sentiment_service._get_sample_quotes(texts, sentiment_scores, 'neu', max_quotes=2)
+    pos, neg = sentiment_service._get_sample_quotes_multi(texts, compounds, max_pos=3, max_neg=3)
     
-    assert isinstance(quotes, list)
-    assert len(quotes) <= 2
+    assert pos == ['This is amazing!']
+    assert neg == []
+
+
+def test_get_sample_quotes_multi(sentiment_service):
+    """Test collecting positive and negative quotes in one scan"""
+    texts = ['Amazing!', 'Terrible!', 'Love it!', 'Awful!', 'Fantastic!']
+    compounds = [0.8, -0.9, 0.7, -0.6, 0.9]
+    
+    pos, neg = sentiment_service._get_sample_quotes_multi(texts, compounds, max_pos=2, max_neg=1)
+    
+    assert pos == ['Amazing!', 'Love it!']
+    assert neg == ['Terrible!']
+
+
+def test_aggregate_scores(sentiment_service):
+    """Test single-pass aggregation of sentiment scores"""
+    texts = ['Amazing!', 'Good.', 'Fine.', 'Bad.', 'Terrible!', 'Awful!']
+    compounds = np.array([0.8, 0.3, 0.0, -0.3, -0.9, -0.7])
+    
+    avg, pos, neu, neg, pos_quotes, neg_quotes = sentiment_service._aggregate_scores(
+        texts, compounds, max_quotes=1
+    )
+    
+    assert abs(avg - (-0.8 / 6)) < 1e-9
+    assert (pos, neu, neg) == (2, 1, 3)
+    assert pos_quotes == ['Amazing!']
+    assert neg_quotes == ['Terrible!']
 
 
 def test_sentiment_analyzer_initialization(sentiment_service):
@@ -250,6 +308,47 @@ def test_sentiment_analyzer_initialization(sentiment_service):
     assert scores['compound'] > 0  # Should be positive
 
 
+def test_score_texts_reuses_duplicate_scores(sentiment_service):
+    """Test that duplicate texts are scored once and share the result"""
+    sentiment_service._compound.cache_clear()
+    compounds = sentiment_service._score_texts(['Great game!', 'Great game!', 'Awful defense.'])
+    
+    assert len(compounds) == 3
+    assert compounds[0] == compounds[1] > 0
+    assert compounds[2] < 0
+    assert sentiment_service._compound.cache_info().misses == 2
+
+
+def test_compound_skips_texts_without_lexicon_words(sentiment_service):
+    """Test that texts with no lexicon token short-circuit to 0 and others match VADER"""
+    texts = ['The game is at 8pm', 'LeBron scored 30 points', 'Not bad at all!!!', 'Kind of meh', 'Catch 22 ;)']
+    
+    for text in texts:
+        assert sentiment_service._compound_uncached(text) == sentiment_service.analyzer.polarity_scores(text)['compound']
+
+
+def test_analyze_sentiment_detailed_large_batch_keeps_negation(sentiment_service):
+    """Test that large batches are scored with full VADER, so negation isn't lost"""
+    posts = [{'title': 'The team is not good', 'text': '', 'comments': []}] * 250
+    
+    result = sentiment_service.analyze_sentiment_detailed(posts)
+    
+    assert result['avg_compound'] < 0
+    assert result['distribution']['neg'] == 250
+
+
+def test_compute_feeds_both_formatters(sentiment_service, sample_reddit_posts):
+    """Test that the summary and detailed views are built from the same scored result"""
+    result = sentiment_service._compute(sample_reddit_posts)
+    detailed = sentiment_service.analyze_sentiment_detailed(sample_reddit_posts)
+    summary = sentiment_service.analyze_sentiment(sample_reddit_posts)
+    
+    assert detailed['avg_compound'] == round(result.avg_compound, 3)
+    assert detailed['distribution']['pos'] + detailed['distribution']['neu'] + detailed['distribution']['neg'] == result.total
+    assert f"compound score: {result.avg_compound:.2f}" in summary
+    assert sentiment_service._compute([{'title': '', 'text': '', 'comments': []}]) is None
+
+
 def test_sentiment_with_only_titles(sentiment_service):
     """Test sentiment analysis with posts that only have titles"""
     posts = [
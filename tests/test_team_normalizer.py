@@ -0,0 +1,50 @@
+from src.app.utils.team_normalizer import TeamNormalizer
+
+
+def test_normalize_exact_aliases():
+    """Test normalization of known names, nicknames and abbreviations"""
+    assert TeamNormalizer.normalize("Lakers") == "Los Angeles Lakers"
+    assert TeamNormalizer.normalize("  GSW ") == "Golden State Warriors"
+    assert TeamNormalizer.normalize("philadelphia 76ers") == "Philadelphia 76ers"
+
+
+def test_normalize_partial_match():
+    """Test normalization of inputs that contain a distinctive team token"""
+    assert TeamNormalizer.normalize("The Lakers") == "Los Angeles Lakers"
+    assert TeamNormalizer.normalize("Warriors fans") == "Golden State Warriors"
+    assert TeamNormalizer.normalize("San Antonio Spurs!") == "San Antonio Spurs"
+    assert TeamNormalizer.normalize("New York") == "New York Knicks"
+    assert TeamNormalizer.normalize("Warrior") == "Golden State Warriors"
+    assert TeamNormalizer.normalize("Sixer") == "Philadelphia 76ers"
+    assert TeamNormalizer.normalize("Cav") == "Cleveland Cavaliers"
+    assert TeamNormalizer.normalize("Grizz") == "Memphis Grizzlies"
+    assert TeamNormalizer.normalize("lake") == "Los Angeles Lakers"
+
+
+def test_normalize_ambiguous_tokens_not_indexed():
+    """Test that tokens shared by several teams don't pick an arbitrary team"""
+    assert "los" not in TeamNormalizer._TOKEN_INDEX
+    assert "la" not in TeamNormalizer._TOKEN_INDEX
+    assert "new" not in TeamNormalizer._TOKEN_INDEX
+    assert TeamNormalizer.normalize("Los Angeles") == "Los Angeles"
+
+
+def test_normalize_no_match():
+    """Test that unknown names are returned trimmed and unchanged"""
+    assert TeamNormalizer.normalize("  Seattle SuperSonics ") == "Seattle SuperSonics"
+    assert TeamNormalizer.normalize("") == ""
+
+
+def test_normalize_multiple():
+    """Test normalizing several names at once"""
+    assert TeamNormalizer.normalize_multiple("celtics", "heat") == ("Boston Celtics", "Miami Heat")
+
+
+def test_normalize_is_memoized():
+    """Test that repeat names are served from the cache"""
+    TeamNormalizer._normalize_cached.cache_clear()
+    TeamNormalizer.normalize("Celtics")
+    TeamNormalizer.normalize("Celtics")
+    info = TeamNormalizer._normalize_cached.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1